@@ -5177,11 +5177,31 @@ def _do_copy_docs(source, target):
     return target
 
 
+@has_docs
+def _do_not_copy_docs(target):
+    """
+    Returns the target object as it is. Used by ``copy_docs`` when docstrings are disabled.
+    
+    Parameters
+    ----------
+    target : `Any`
+        The target object.
+    
+    Returns
+    -------
+    target : `Any`
+        The target object.
+    """
+    return target
+
+
 @has_docs
 def copy_docs(source):
     """
     Copies a function's doc-string to an other one.
     
+    If docstrings are disabled, the returned wrapper leaves the target object untouched.
+    
     Parameters
     ----------
     source : `Any`
@@ -5189,7 +5209,7 @@ def copy_docs(source):
     
     Returns
     -------
-    wrapper : ``functools.partial``
+    wrapper : ``functools.partial`` or `function`
         Wrapper which will change the target object's docstring.
     
     Examples
@@ -5205,7 +5225,10 @@ def copy_docs(source):
         pass
     ```
     """
-    return partial_func(_do_copy_docs, source)
+    if DOCS_ENABLED:
+        return partial_func(_do_copy_docs, source)
+    
+    return _do_not_copy_docs
 
 
 @has_docs
@@ -14,12 +14,36 @@ from ..http import urls as module_urls
 Client = include('Client')
 Guild = include('Guild')
 
-UNICODE_EMOJI_LIMIT = 1<<21
-
 BUILTIN_EMOJIS = {}
 UNICODE_TO_EMOJI = {}
 
 
+def _create_roles_from_ids(role_ids):
+    """
+    Creates the roles of an emoji from the given role identifiers.
+    
+    Parameters
+    ----------
+    role_ids : `None` or `list` of (`str`, `int`)
+        The received role identifiers.
+    
+    Returns
+    -------
+    roles : `None` or `tuple` of ``Role``
+        The roles sorted by their identifier. If there are no roles given, returns `None`.
+    """
+    if (role_ids is None) or (not role_ids):
+        return None
+    
+    # Most limited emojis are limited to one role, so skip sorting at that case.
+    if len(role_ids) == 1:
+        return (create_partial_role_from_id(int(role_ids[0])),)
+    
+    roles = [create_partial_role_from_id(int(role_id)) for role_id in role_ids]
+    roles.sort(key=id_sort_key)
+    return tuple(roles)
+
+
 class Emoji(DiscordEntity, immortal=True):
     """
     Represents a Discord emoji. It can be custom or builtin (unicode) emoji as well. Builtin emojis are loaded when the
@@ -83,10 +107,9 @@ class Emoji(DiscordEntity, immortal=True):
         emoji : ``Emoji``
         """
         emoji_id = int(data['id'])
-
-        try:
-            self = EMOJIS[emoji_id]
-        except KeyError:
+        
+        self = EMOJIS.get(emoji_id, None)
+        if self is None:
             self = object.__new__(cls)
             self.id = emoji_id
             EMOJIS[emoji_id] = self
@@ -129,13 +152,7 @@ class Emoji(DiscordEntity, immortal=True):
         
         self.unicode = None
         
-        role_ids = data.get('roles', None)
-        if (role_ids is None) or (not role_ids):
-            roles = None
-        else:
-            roles = tuple(sorted((create_partial_role_from_id(int(role_id)) for role_id in role_ids), key=id_sort_key))
-        
-        self.roles = roles
+        self.roles = _create_roles_from_ids(data.get('roles', None))
         
         return self
     
@@ -311,8 +328,9 @@ class Emoji(DiscordEntity, immortal=True):
             return self.name
         
         if code == 'e':
-            if self.id < UNICODE_EMOJI_LIMIT:
-                return self.unicode
+            unicode = self.unicode
+            if (unicode is not None):
+                return unicode
             
             if self.animated:
                 return f'<a:{self.name}:{self.id}>'
@@ -320,8 +338,9 @@ class Emoji(DiscordEntity, immortal=True):
                 return f'<:{self.name}:{self.id}>'
         
         if code == 'r':
-            if self.id < UNICODE_EMOJI_LIMIT:
-                return self.unicode
+            unicode = self.unicode
+            if (unicode is not None):
+                return unicode
             
             return f'{self.name}:{self.id}'
         
@@ -356,7 +375,7 @@ class Emoji(DiscordEntity, immortal=True):
         -------
         is_custom_emoji : `bool`
         """
-        return (self.id >= UNICODE_EMOJI_LIMIT)
+        return (self.unicode is None)
 
     def is_unicode_emoji(self):
         """
@@ -366,7 +385,7 @@ class Emoji(DiscordEntity, immortal=True):
         -------
         is_custom_emoji : `bool`
         """
-        return (self.id < UNICODE_EMOJI_LIMIT)
+        return (self.unicode is not None)
     
     @property
     def as_reaction(self):
@@ -377,8 +396,9 @@ class Emoji(DiscordEntity, immortal=True):
         -------
         as_reaction : `str`
         """
-        if self.id < UNICODE_EMOJI_LIMIT:
-            return self.unicode
+        unicode = self.unicode
+        if (unicode is not None):
+            return unicode
         
         return f'{self.name}:{self.id}'
     
@@ -391,8 +411,9 @@ class Emoji(DiscordEntity, immortal=True):
         -------
         as_emoji : `str`
         """
-        if self.id < UNICODE_EMOJI_LIMIT:
-            return self.unicode
+        unicode = self.unicode
+        if (unicode is not None):
+            return unicode
         
         if self.animated:
             return f'<a:{self.name}:{self.id}>'
@@ -408,9 +429,8 @@ class Emoji(DiscordEntity, immortal=True):
         -------
         created_at : `datetime`
         """
-        id_ = self.id
-        if id_ > UNICODE_EMOJI_LIMIT:
-            created_at = id_to_time(id_)
+        if self.unicode is None:
+            created_at = id_to_time(self.id)
         else:
             created_at = DISCORD_EPOCH_START
         
@@ -454,13 +474,7 @@ class Emoji(DiscordEntity, immortal=True):
         
         self.name = name
         
-        role_ids = data.get('roles', None)
-        if (role_ids is None) or (not role_ids):
-            roles = None
-        else:
-            roles = tuple(sorted((create_partial_role_from_id(int(role_id)) for role_id in role_ids), key=id_sort_key))
-        
-        self.roles = roles
+        self.roles = _create_roles_from_ids(data.get('roles', None))
         
         try:
             user_data = data['user']
@@ -507,36 +521,43 @@ class Emoji(DiscordEntity, immortal=True):
         old_attributes = {}
         
         require_colons = data.get('require_colons', True)
-        if self.require_colons != require_colons:
-            old_attributes['require_colons'] = self.require_colons
+        self_require_colons = self.require_colons
+        if self_require_colons != require_colons:
+            old_attributes['require_colons'] = self_require_colons
             self.require_colons = require_colons
         
         managed = data.get('managed', False)
-        if self.managed != managed:
-            old_attributes['managed'] = self.managed
+        self_managed = self.managed
+        if self_managed != managed:
+            old_attributes['managed'] = self_managed
             self.managed = managed
         
         animated = data.get('animated', False)
-        if self.animated != animated:
-            old_attributes['animated'] = self.animated
+        self_animated = self.animated
+        if self_animated != animated:
+            old_attributes['animated'] = self_animated
             self.animated = animated
         
         name = data['name']
         if name is None:
             name = ''
-        if self.name != name:
-            old_attributes['name'] = self.name
+        self_name = self.name
+        if self_name != name:
+            old_attributes['name'] = self_name
             self.name = name
         
         role_ids = data.get('roles', None)
+        self_roles = self.roles
         if (role_ids is None) or (not role_ids):
-            roles = None
+            # Most emojis are not limited to roles, so skip building any `tuple` if both sides are empty.
+            if (self_roles is not None):
+                old_attributes['roles'] = self_roles
+                self.roles = None
         else:
-            roles = tuple(sorted((create_partial_role_from_id(int(role_id)) for role_id in role_ids), key=id_sort_key))
-        
-        if self.roles != roles:
-            old_attributes['roles'] = self.roles
-            self.roles = roles
+            roles = _create_roles_from_ids(role_ids)
+            if self_roles != roles:
+                old_attributes['roles'] = self_roles
+                self.roles = roles
         
         try:
             user_data = data['user']
@@ -546,8 +567,9 @@ class Emoji(DiscordEntity, immortal=True):
             self.user = User(user_data)
         
         available = data.get('available', True)
-        if self.available != available:
-            old_attributes['available'] = self.available
+        self_available = self.available
+        if self_available != available:
+            old_attributes['available'] = self_available
             self.available = available
         
         return old_attributes
@@ -573,14 +595,16 @@ class Emoji(DiscordEntity, immortal=True):
         """
         emoji_id = int(emoji_id)
         
-        try:
-            self = EMOJIS[emoji_id]
-            if self.partial:
-                self.name = name
-        except KeyError:
+        self = EMOJIS.get(emoji_id, None)
+        if self is None:
             self = cls._create_empty(emoji_id)
+            self.name = name
+            self.animated = animated
             EMOJIS[emoji_id] = self
         
+        elif self.partial:
+            self.name = name
+        
         return self
     
     
@@ -1,8 +1,12 @@
 __all__ = ('reaction_mapping', 'reaction_mapping_line',)
 
+from bisect import bisect_right
+
 from ...backend.export import include
 from ...backend.utils import set_docs
 
+from ..bases import id_sort_key
+
 from .utils import create_partial_emoji_from_data
 
 Client = include('Client')
@@ -56,11 +60,7 @@ class reaction_mapping(dict):
         -------
         total_count : `int`
         """
-        count = 0
-        for line in self.values():
-            count += set.__len__(line)
-            count += line.unknown
-        return count
+        return sum(set.__len__(line)+line.unknown for line in self.values())
     
     
     def clear(self):
@@ -103,32 +103,32 @@ class reaction_mapping(dict):
         user : ``User`` or ``Client``
             The removed reactor user.
         """
+        line = self.get(emoji, None)
+        if line is None:
+            return
+        
         try:
-            line = self[emoji]
+            set.remove(line, user)
         except KeyError:
-            return
-
-        if set.__len__(line):
-            try:
-                line.remove(user)
-            except KeyError:
-                pass
-            else:
-                if set.__len__(line) or line.unknown:
-                    return
-                del self[emoji]
+            # The user is not known, so decrease the unknown reactors instead.
+            unknown = line.unknown
+            if not unknown:
                 return
-        
-        if line.unknown:
-            line.unknown -=1
+            
+            unknown -= 1
+            line.unknown = unknown
+            if unknown:
+                return
+            
             if set.__len__(line):
-                if line.unknown:
-                    return
                 self._full_check()
                 return
-            if line.unknown:
+        
+        else:
+            if set.__len__(line) or line.unknown:
                 return
-            del self[emoji]
+        
+        del self[emoji]
     
     
     def remove_emoji(self, emoji):
@@ -194,7 +194,14 @@ class reaction_mapping(dict):
         users : `list` of ``ClientUserBase``
             The added reactors.
         """
-        self[emoji] = reaction_mapping_line._full(users)
+        line = self.get(emoji, None)
+        if line is None:
+            self[emoji] = reaction_mapping_line._full(users)
+        else:
+            set.clear(line)
+            set.update(line, users)
+            line.unknown = 0
+        
         self._full_check()
 
 
@@ -230,18 +237,10 @@ class reaction_mapping_line(set):
         repr_parts = [
             self.__class__.__name__,
             '({',
+            ', '.join(map(repr, self)),
+            '}',
         ]
         
-        # set indexing is not public, so we need to do a check, like this
-        if set.__len__(self):
-            for user in self:
-                repr_parts.append(repr(user))
-                repr_parts.append(', ')
-            
-            repr_parts[-1] = '}'
-        else:
-            repr_parts.append('}')
-        
         unknown = self.unknown
         if unknown:
             repr_parts.append(', unknown=')
@@ -316,53 +315,26 @@ class reaction_mapping_line(set):
         
         Returns
         -------
-        users : `
+        users : `list` of ``ClientUserBase``
         """
-        list_form = sorted(self)
-        
-        after = after+1 # do not include the specified id
-        
-        bot = 0
-        top = len(list_form)
-        while True:
-            if bot < top:
-                half = (bot+top)>>1
-                if list_form[half].id < after:
-                    bot = half+1
-                else:
-                    top = half
-                continue
-            break
-        
-        index = bot
+        if limit <= 0:
+            return []
         
-        length = len(list_form)
-        users = []
+        users = sorted(self, key=id_sort_key)
         
-        while True:
-            if index == length:
-                break
-            
-            if limit <= 0:
-                break
-            
-            users.append(list_form[index])
-            index += 1
-            limit -= 1
-            continue
+        # do not include the specified id
+        index = bisect_right([user.id for user in users], after)
         
-        return users
+        return users[index:index+limit]
     
     
     def clear(self):
         """
         Clears the reaction mapping line by removing every ``User`` object from it.
         """
-        clients = []
-        for user in self:
-            if isinstance(user, Client):
-                clients.append(user)
-
+        clients = [user for user in self if isinstance(user, Client)]
+        
         self.unknown += (set.__len__(self) - len(clients))
         set.clear(self)
-        set.update(self,clients)
+        if clients:
+            set.update(self, clients)
@@ -23,9 +23,9 @@ def create_partial_emoji_from_data(data):
     -------
     emoji : ``Emoji``
     """
-    try:
-        name = data['name']
-    except KeyError:
+    # `name` can be `None` as well, so use ellipsis to detect whether the key is missing.
+    name = data.get('name', ...)
+    if name is ...:
         name = data['emoji_name']
         emoji_id = data.get('emoji_id', None)
         emoji_animated = data.get('emoji_animated', False)
@@ -34,17 +34,16 @@ def create_partial_emoji_from_data(data):
         emoji_animated = data.get('animated', False)
     
     if emoji_id is None:
-        try:
-            return UNICODE_TO_EMOJI[name]
-        except KeyError:
-            raise RuntimeError(f'Undefined emoji : {name.encode()!r}\nPlease open an issue with this message.') \
-                from None
+        emoji = UNICODE_TO_EMOJI.get(name, None)
+        if emoji is None:
+            raise RuntimeError(f'Undefined emoji : {name.encode()!r}\nPlease open an issue with this message.')
+        
+        return emoji
     
     emoji_id = int(emoji_id)
     
-    try:
-        emoji = EMOJIS[emoji_id]
-    except KeyError:
+    emoji = EMOJIS.get(emoji_id, None)
+    if emoji is None:
         emoji = object.__new__(Emoji)
         emoji.id = emoji_id
         emoji.animated = emoji_animated
@@ -126,8 +125,8 @@ def parse_custom_emojis(text):
     emojis : `set` of ``Emoji``
     """
     emojis = set()
-    for groups in EMOJI_RP.findall(text):
-        animated, name, emoji_id = groups
+    for parsed in EMOJI_RP.finditer(text):
+        animated, name, emoji_id = parsed.groups()
         animated = (animated is not None)
         emoji_id = int(emoji_id)
         emoji = Emoji._create_partial(emoji_id, name, animated)
@@ -149,14 +148,11 @@ def parse_reaction(text):
     -------
     emoji : `None` or ``Emoji``
     """
-    try:
-        emoji = UNICODE_TO_EMOJI[text]
-    except KeyError:
+    emoji = UNICODE_TO_EMOJI.get(text, None)
+    if emoji is None:
         parsed = REACTION_RP.fullmatch(text)
-        if parsed is None:
-            emoji = None
-        else:
-            name, emoji_id = parsed.parsed()
+        if (parsed is not None):
+            name, emoji_id = parsed.groups()
             emoji_id = int(emoji_id)
             emoji = Emoji._create_partial(emoji_id, name, False)
     
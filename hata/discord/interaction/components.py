@@ -361,6 +361,52 @@ def create_auto_custom_id():
     return to_base85(random_bytes(64)).decode()
 
 
+def _postprocess_button_style_and_custom_id(style, custom_id, url, default_style):
+    """
+    Post-processes a button's `style` and `custom_id` after it's fields were validated.
+    
+    Link buttons always have `ButtonStyle.link` style, meanwhile other buttons fall back to `default_style` and get an
+    auto generated `custom_id` if not given.
+    
+    Parameters
+    ----------
+    style : `None`, ``ButtonStyle``, `int`
+        The button's style.
+    custom_id : `None` or `str`
+        The button's custom identifier.
+    url : `None` or `str`
+        The button's url.
+    default_style : ``ButtonStyle``
+        The style to use if `style` is not given.
+    
+    Returns
+    -------
+    style : ``ButtonStyle``
+        The button's style.
+    custom_id : `None` or `str`
+        The button's custom identifier.
+    
+    Raises
+    ------
+    TypeError
+        If `style`'s type is unexpected.
+    ValueError
+        If `style` was given as `int`, but there is no predefined style for it.
+    """
+    if (url is not None):
+        return ButtonStyle.link, custom_id
+    
+    if style is None:
+        style = default_style
+    elif (style.__class__ is not ButtonStyle):
+        style = preconvert_preinstanced_type(style, 'style', ButtonStyle)
+    
+    if (custom_id is None):
+        custom_id = create_auto_custom_id()
+    
+    return style, custom_id
+
+
 @export
 class ComponentBase:
     """
@@ -754,17 +800,7 @@ class ComponentButton(ComponentBase):
                 raise AssertionError(f'`custom_id` and `url` fields are mutually exclusive, got '
                     f'custom_id={custom_id!r}, url={url!r}.')
         
-        if (url is None):
-            if style is None:
-                style = cls.default_style
-            else:
-                style = preconvert_preinstanced_type(style, 'style', ButtonStyle)
-            
-            if (custom_id is None):
-                custom_id = create_auto_custom_id()
-        
-        else:
-            style = ButtonStyle.link
+        style, custom_id = _postprocess_button_style_and_custom_id(style, custom_id, url, cls.default_style)
         
         if (label is not None) and (not label):
             label = None
@@ -995,17 +1031,7 @@ class ComponentButton(ComponentBase):
                 raise AssertionError(f'`custom_id` and `url` fields are mutually exclusive, got '
                     f'custom_id={custom_id!r}, url={url!r}.')
         
-        if (url is None):
-            if style is None:
-                style = cls.default_style
-            else:
-                style = preconvert_preinstanced_type(style, 'style', ButtonStyle)
-            
-            if (custom_id is None):
-                custom_id = create_auto_custom_id()
-        
-        else:
-            style = ButtonStyle.link
+        style, custom_id = _postprocess_button_style_and_custom_id(style, custom_id, url, type(self).default_style)
         
         new = object.__new__(type(self))
         